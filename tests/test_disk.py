@@ -226,3 +226,30 @@ def test_disk_rbd_path():
     disk1 = virtinst.DeviceDisk(conn, parsexml=diskxml1)
     disk1.set_backend_for_existing_path()
     assert disk1.get_vol_object().name() == "some-rbd-vol"
+
+
+def test_disk_lookup_after_vol_create():
+    # Storage lookups are memoized on the connection: creating a new
+    # volume must invalidate them, so a path that was probed before
+    # the volume existed is found by a followup probe
+    conn = utils.URIs.open_testdriver_cached()
+    poolobj = conn.storagePoolLookupByName("default-pool")
+    volname = "lookup-after-create.img"
+    volpath = "/dev/default-pool/" + volname
+
+    # Prime the lookup caches before the volume exists
+    assert DeviceDisk.path_definitely_exists(conn, volpath) is False
+
+    volinst = virtinst.StorageVolume(conn)
+    volinst.pool = poolobj
+    volinst.name = volname
+    volinst.capacity = 1024 * 1024
+    volobj = volinst.install(meter=False)
+
+    try:
+        assert DeviceDisk.path_definitely_exists(conn, volpath) is True
+    finally:
+        volobj.delete(0)
+        # Don't leave a lookup result for the deleted volume behind
+        # on the shared connection
+        conn.invalidate_storage_lookup_caches()
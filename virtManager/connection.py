@@ -4,6 +4,7 @@
 # This work is licensed under the GNU GPLv2 or later.
 # See the COPYING file in the top-level directory.
 
+import logging
 import os
 import threading
 import time
@@ -820,7 +821,7 @@ class vmmConnection(vmmGObject):
             self.using_node_device_events = True
             log.debug("Using node device events")
         except Exception as e:
-            self.using_network_events = False
+            self.using_node_device_events = False
             log.debug("Error registering node device events: %s", e)
 
 
@@ -952,7 +953,10 @@ class vmmConnection(vmmGObject):
         log.debug("libvirt version=%s", self._backend.local_libvirt_version())
         log.debug("daemon version=%s", self._backend.daemon_version())
         log.debug("conn version=%s", self._backend.conn_version())
-        log.debug("%s capabilities:\n%s", self.get_uri(), self.caps.get_xml())
+        if log.isEnabledFor(logging.DEBUG):
+            # don't serialize the capabilities XML if it won't be logged
+            log.debug("%s capabilities:\n%s",
+                    self.get_uri(), self.caps.get_xml())
 
         if not self.support.conn_domain():  # pragma: no cover
             raise RuntimeError("Connection does not support required "
@@ -4,6 +4,7 @@
 # This work is licensed under the GNU GPLv2 or later.
 # See the COPYING file in the top-level directory.
 
+import logging
 import os
 import time
 import threading
@@ -1673,7 +1674,11 @@ class vmmDomainVirtinst(vmmDomain):
         self._installer = installer
 
         self._refresh_status()
-        log.debug("%s initialized with XML=\n%s", self, self._XMLDesc(0))
+        if log.isEnabledFor(logging.DEBUG):
+            # the XMLDesc fetch is only worth the round-trip if it
+            # actually ends up in the log
+            log.debug("%s initialized with XML=\n%s",
+                    self, self._XMLDesc(0))
 
     def get_name(self):
         return self._backend.name
@@ -3326,7 +3326,8 @@ class ParserDisk(VirtCLIParser):
                 if poolxml:
                     poolname = poolxml.name
             poolobj = self.guest.conn.storagePoolLookupByName(poolname)
-            StoragePool.ensure_pool_is_running(poolobj)
+            if StoragePool.ensure_pool_is_running(poolobj):
+                self.guest.conn.invalidate_storage_lookup_caches()
 
         if volname:
             vol_object = poolobj.storageVolLookupByName(volname)
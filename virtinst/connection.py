@@ -171,6 +171,32 @@ class VirtinstConnection(object):
     _FETCH_KEY_POOLS = "pools"
     _FETCH_KEY_VOLS = "vols"
     _FETCH_KEY_NODEDEVS = "nodedevs"
+    _STORAGE_LOOKUP_PREFIX = "storagelookup-"
+
+    def get_storage_lookup_cache(self, name):
+        """
+        Return a dict that diskbackend.py can memoize storage lookups
+        in, or None if memoizing should be skipped. The dicts live in
+        _fetch_cache so they are dropped on close() and can be
+        invalidated alongside the object list caches. When an app like
+        virt-manager registers fetch callbacks it changes storage state
+        outside our view, so hand back no cache at all in that case.
+        """
+        if self.cb_fetch_all_pools or self.cb_fetch_all_vols:
+            return None  # pragma: no cover
+        key = self._STORAGE_LOOKUP_PREFIX + name
+        if key not in self._fetch_cache:
+            self._fetch_cache[key] = {}
+        return self._fetch_cache[key]
+
+    def invalidate_storage_lookup_caches(self):
+        """
+        Drop all storage lookup caches, for when pool or volume state
+        may have changed behind them
+        """
+        for key in list(self._fetch_cache):
+            if key.startswith(self._STORAGE_LOOKUP_PREFIX):
+                del self._fetch_cache[key]
 
     def _fetch_helper(self, key, raw_cb, override_cb):
         if override_cb:
@@ -209,13 +235,16 @@ class VirtinstConnection(object):
         return [NodeDevice(weakref.proxy(self), obj.XMLDesc(0))
                 for obj in ret]
 
-    def _fetch_vols_raw(self, poolxmlobj):
+    def _fetch_vols_raw(self, poolxmlobj, pool=None):
         ret = []
-        # TOCTOU race: a volume may go away in between enumeration and inspection
-        try:
-            pool = self._libvirtconn.storagePoolLookupByName(poolxmlobj.name)
-        except libvirt.libvirtError as e:  # pragma: no cover
-            return ret
+        if pool is None:
+            # TOCTOU race: a pool may go away in between enumeration
+            # and inspection
+            try:
+                pool = self._libvirtconn.storagePoolLookupByName(
+                        poolxmlobj.name)
+            except libvirt.libvirtError as e:  # pragma: no cover
+                return ret
 
         if pool.info()[0] != libvirt.VIR_STORAGE_POOL_RUNNING:
             return ret
@@ -232,9 +261,21 @@ class VirtinstConnection(object):
         return ret
 
     def _fetch_all_vols_raw(self):
+        # One listAllStoragePools call hands us every pool object,
+        # rather than a lookupByName round-trip per pool
+        dummy1, dummy2, poolobjs = pollhelpers.fetch_pools(
+            self, {}, lambda obj, ignore: obj)
+        poolmap = {}
+        for poolobj in poolobjs:
+            try:
+                poolmap[poolobj.name()] = poolobj
+            except libvirt.libvirtError:  # pragma: no cover
+                continue
+
         ret = []
         for poolxmlobj in self.fetch_all_pools():
-            ret.extend(self._fetch_vols_raw(poolxmlobj))
+            ret.extend(self._fetch_vols_raw(
+                poolxmlobj, poolmap.get(poolxmlobj.name)))
         return ret
 
     def _cache_new_pool_raw(self, poolobj):
@@ -257,6 +298,7 @@ class VirtinstConnection(object):
         """
         Insert the passed poolobj into our cache
         """
+        self.invalidate_storage_lookup_caches()
         if self.cb_cache_new_pool:
             # pylint: disable=not-callable
             return self.cb_cache_new_pool(poolobj)
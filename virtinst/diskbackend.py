@@ -6,6 +6,8 @@
 # This work is licensed under the GNU GPLv2 or later.
 # See the COPYING file in the top-level directory.
 
+import errno
+import fcntl
 import os
 import re
 import stat
@@ -18,6 +20,30 @@ from .storage import StoragePool, StorageVolume
 from . import xmlutil
 
 
+_BYTES_PER_MIB = 1024 * 1024
+_BYTES_PER_GIB = 1024 * 1024 * 1024
+
+
+def _get_vol_path_map(conn):
+    """
+    Return a {target_path: volume type} map covering every volume on
+    `conn`. Building it walks all volume XML, so keep it in the
+    connection's storage lookup cache rather than rescanning for each
+    disk path. If the connection doesn't offer a cache, because an app
+    like virt-manager changes volumes underneath us, rebuild from its
+    volume list every call.
+    """
+    cache = conn.get_storage_lookup_cache("volpathmap")
+    if not cache:
+        newmap = {}
+        for volxml in conn.fetch_all_vols():
+            newmap[volxml.target_path] = volxml.type
+        if cache is None:
+            return newmap  # pragma: no cover
+        cache.update(newmap)
+    return cache
+
+
 def _lookup_vol_by_path(conn, path):
     """
     Try to find a volume matching the full passed path. Call info() on
@@ -46,8 +72,13 @@ def _lookup_vol_by_basename(pool, path):
     since not all libvirt storage backends implement path lookup.
     """
     name = os.path.basename(path)
-    if name in pool.listVolumes():
+    try:
         return pool.storageVolLookupByName(name)
+    except libvirt.libvirtError as e:
+        if (e.get_error_code() and
+            e.get_error_code() != libvirt.VIR_ERR_NO_STORAGE_VOL):
+            raise  # pragma: no cover
+        return None
 
 
 def _get_block_size(path):  # pragma: no cover
@@ -61,18 +92,25 @@ def _get_block_size(path):  # pragma: no cover
     return size
 
 
-def _get_size(path):
-    if not os.path.exists(path):
-        return 0
-    if _stat_is_block(path):
-        return _get_block_size(path)  # pragma: no cover
-    return os.path.getsize(path)
+def _stat_disk(path):
+    """
+    Single os.stat covering the exists/size/is-block checks. Returns
+    None if the path doesn't exist.
+    """
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
 
 
-def _stat_is_block(path):
-    if not os.path.exists(path):
-        return False
-    return stat.S_ISBLK(os.stat(path)[stat.ST_MODE])
+def _get_size(path, statinfo=None):
+    if statinfo is None:
+        statinfo = _stat_disk(path)
+    if statinfo is None:
+        return 0
+    if stat.S_ISBLK(statinfo.st_mode):
+        return _get_block_size(path)  # pragma: no cover
+    return statinfo.st_size
 
 
 def _check_if_path_managed(conn, path):
@@ -80,7 +118,27 @@ def _check_if_path_managed(conn, path):
     Try to lookup storage objects for the passed path.
 
     Returns (volume, parent pool). Only one is returned at a time.
+
+    The lookup does several libvirt round-trips, and callers like
+    manage_path and path_definitely_exists may ask about the same path
+    repeatedly, so memoize results in the connection's storage lookup
+    cache, which is dropped whenever pool or volume state changes.
     """
+    cache = conn.get_storage_lookup_cache("pathmanaged")
+    if cache is not None and path in cache:
+        return cache[path]
+
+    ret = _check_if_path_managed_raw(conn, path)
+
+    # The lookup may have invalidated our cache via a pool refresh,
+    # so store into whatever dict is current
+    cache = conn.get_storage_lookup_cache("pathmanaged")
+    if cache is not None:
+        cache[path] = ret
+    return ret
+
+
+def _check_if_path_managed_raw(conn, path):
     vol, ignore = _lookup_vol_by_path(conn, path)
     if vol:
         return vol, vol.storagePoolLookupByVolume()
@@ -94,6 +152,7 @@ def _check_if_path_managed(conn, path):
     # of date or the pool was inactive.
     try:
         StoragePool.ensure_pool_is_running(pool, refresh=True)
+        conn.invalidate_storage_lookup_caches()
         vol, verr = _lookup_vol_by_path(conn, path)
         if verr:
             try:
@@ -112,17 +171,19 @@ def _check_if_path_managed(conn, path):
     return vol, pool
 
 
-def _can_auto_manage(path):
+# Paths we don't try to auto-import into a pool
+_SKIP_AUTO_MANAGE_RE = re.compile(r"/(?:dev|sys|proc)(?:/|$)")
+
+
+def _can_auto_manage(path, is_url=None):
     path = path or ""
-    skip_prefixes = ["/dev", "/sys", "/proc"]
 
-    if path_is_url(path):
+    if is_url is None:
+        is_url = path_is_url(path)
+    if is_url:
         return False
 
-    for prefix in skip_prefixes:
-        if path.startswith(prefix + "/") or path == prefix:
-            return False
-    return True
+    return not _SKIP_AUTO_MANAGE_RE.match(path)
 
 
 def _get_storage_search_path(path):
@@ -145,12 +206,15 @@ def manage_path(conn, path):
     if not path:
         return None, None
 
-    if not path_is_url(path) and not path_is_network_vol(conn, path):
+    is_url = path_is_url(path)
+    if not is_url and not path_is_network_vol(conn, path):
         path = os.path.abspath(path)
 
-    searchpath = _get_storage_search_path(path)
+    searchpath = path
+    if is_url:
+        searchpath = _get_storage_search_path(path)
     vol, pool = _check_if_path_managed(conn, searchpath)
-    if vol or pool or not _can_auto_manage(path):
+    if vol or pool or not _can_auto_manage(path, is_url):
         return vol, pool
 
     dirname = os.path.dirname(path)
@@ -164,30 +228,36 @@ def manage_path(conn, path):
     poolxml.name = poolname
     poolxml.type = poolxml.TYPE_DIR
     poolxml.target_path = dirname
+    # install() routes through cache_new_pool, which drops the storage
+    # lookup caches, so paths we previously reported as unmanaged but
+    # that the new pool owns will be looked up fresh
     pool = poolxml.install(build=False, create=True, autostart=True)
 
     vol = _lookup_vol_by_basename(pool, path)
     return vol, pool
 
 
+_PATH_IS_URL_RE = re.compile(r"[a-zA-Z]+(\+[a-zA-Z]+)?://.*")
+
+
 def path_is_url(path):
     """
     Detect if path is a URL
     """
-    return bool(re.match(r"[a-zA-Z]+(\+[a-zA-Z]+)?://.*", path or ""))
+    return bool(_PATH_IS_URL_RE.match(path or ""))
 
 
 def path_is_network_vol(conn, path):
     """
     Detect if path is a network volume such as rbd, gluster, etc
     """
-    for volxml in conn.fetch_all_vols():
-        if path and volxml.target_path == path:
-            return volxml.type == "network"
-    return False
+    if not path:
+        return False
+    return _get_vol_path_map(conn).get(path) == "network"
 
 
-def _get_dev_type(path, vol_xml, vol_object, pool_xml, remote):
+def _get_dev_type(path, vol_xml, vol_object, pool_xml, remote,
+        statinfo=None):
     """
     Try to get device type for volume.
     """
@@ -224,9 +294,11 @@ def _get_dev_type(path, vol_xml, vol_object, pool_xml, remote):
                 return "block"
 
         else:
-            if os.path.isdir(path):
+            if statinfo is None:
+                statinfo = _stat_disk(path)
+            if statinfo and stat.S_ISDIR(statinfo.st_mode):
                 return "dir"
-            elif _stat_is_block(path):
+            elif statinfo and stat.S_ISBLK(statinfo.st_mode):
                 return "block"  # pragma: no cover
 
     return "file"
@@ -261,12 +333,12 @@ def path_definitely_exists(conn, path):
 SETFACL = "setfacl"
 
 
-def _fix_perms_acl(dirname, username):
-    cmd = [SETFACL, "--modify", "user:%s:x" % username, dirname]
-    proc = subprocess.Popen(cmd,
-                            stdout=subprocess.PIPE,
-                            stderr=subprocess.PIPE)
-    out, err = proc.communicate()
+def _fix_perms_acl(dirlist, username):
+    # setfacl accepts multiple paths, so fix every dir with a
+    # single invocation rather than forking a process per dir
+    cmd = [SETFACL, "--modify", "user:%s:x" % username] + dirlist
+    proc = subprocess.run(cmd, capture_output=True, check=False)
+    out, err = proc.stdout, proc.stderr
 
     log.debug("Ran command '%s'", cmd)
     if out or err:
@@ -289,18 +361,18 @@ def _fix_perms_chmod(dirname):
 
 
 def set_dirs_searchable(dirlist, username):
-    useacl = True
     errdict = {}
-    for dirname in dirlist:
-        if useacl:
-            try:
-                _fix_perms_acl(dirname, username)
-                continue
-            except Exception as e:
-                log.debug("setfacl failed: %s", e)
-                log.debug("trying chmod")
-                useacl = False
+    if not dirlist:
+        return errdict
+
+    try:
+        _fix_perms_acl(dirlist, username)
+        return errdict
+    except Exception as e:
+        log.debug("setfacl failed: %s", e)
+        log.debug("trying chmod")
 
+    for dirname in dirlist:
         try:
             # If we reach here, ACL setting failed, try chmod
             _fix_perms_chmod(dirname)
@@ -310,7 +382,7 @@ def set_dirs_searchable(dirlist, username):
     return errdict
 
 
-def _is_dir_searchable(dirname, uid, username):
+def _is_dir_searchable(dirname, uid):
     """
     Check if passed directory is searchable by uid
     """
@@ -326,26 +398,39 @@ def _is_dir_searchable(dirname, uid, username):
     else:
         flag = stat.S_IXOTH
 
-    if bool(statinfo.st_mode & flag):
-        return True
+    return bool(statinfo.st_mode & flag)
+
 
-    # Check POSIX ACL (since that is what we use to 'fix' access)
-    cmd = ["getfacl", dirname]
+def _acl_searchable_dirs(dirlist, username):
+    """
+    Check POSIX ACL (since that is what we use to 'fix' access) for
+    all passed dirs with a single getfacl invocation. Returns the
+    set of dirs the ACLs make searchable for username.
+    """
+    cmd = ["getfacl", "--absolute-names"] + dirlist
     try:
-        proc = subprocess.Popen(cmd,
-                                stdout=subprocess.PIPE,
-                                stderr=subprocess.PIPE)
-        out, err = proc.communicate()
+        proc = subprocess.run(cmd, capture_output=True, check=False)
+        out, err = proc.stdout, proc.stderr
     except OSError:  # pragma: no cover
         log.debug("Didn't find the getfacl command.")
-        return False
+        return set()
 
     if proc.returncode != 0:  # pragma: no cover
+        # An unreadable dir fails the whole command, but getfacl still
+        # prints the sections it could read, so keep parsing
         log.debug("Cmd '%s' failed: %s", cmd, err)
-        return False
 
-    pattern = "user:%s:..x" % username
-    return bool(re.search(pattern.encode("utf-8", "replace"), out))
+    pattern = re.compile(
+            ("user:%s:..x" % username).encode("utf-8", "replace"))
+    ret = set()
+    for section in out.split(b"\n\n"):
+        match = re.search(rb"^# file: (.*)$", section, re.MULTILINE)
+        if not match:
+            continue
+        dirname = match.group(1).decode("utf-8", "replace")
+        if dirname in dirlist and pattern.search(section):
+            ret.add(dirname)
+    return ret
 
 
 def is_path_searchable(path, uid, username):
@@ -362,11 +447,17 @@ def is_path_searchable(path, uid, username):
 
     fixlist = []
     while base:
-        if not _is_dir_searchable(dirname, uid, username):
+        if not _is_dir_searchable(dirname, uid):
             fixlist.append(dirname)
         dirname, base = os.path.split(dirname)
 
-    return fixlist
+    if not fixlist:
+        return fixlist
+
+    # Permission bits didn't allow access. Before declaring the dirs
+    # unsearchable, check ACLs, batched into one getfacl call
+    searchable = _acl_searchable_dirs(fixlist, username)
+    return [dirname for dirname in fixlist if dirname not in searchable]
 
 
 ##############################################
@@ -380,6 +471,12 @@ class _StorageBase(object):
     def __init__(self, conn):
         self._conn = conn
         self._parent_pool_xml = None
+        self._remote = None
+
+    def _is_remote(self):
+        if self._remote is None:
+            self._remote = self._conn.is_remote()
+        return self._remote
 
     def get_size(self):
         raise NotImplementedError()
@@ -395,8 +492,23 @@ class _StorageBase(object):
         raise NotImplementedError()
     def get_parent_pool_xml(self):
         if not self._parent_pool_xml and self.get_parent_pool():
-            self._parent_pool_xml = StoragePool(self._conn,
-                parsexml=self.get_parent_pool().XMLDesc(0))
+            # Many disks routinely share a parent pool, so share the
+            # parsed XML between their backends via the connection's
+            # storage lookup cache rather than fetching a copy per
+            # disk. Key by UUID, not name: a pool can be deleted and
+            # recreated under the same name with a different config
+            poolobj = self.get_parent_pool()
+            cache = self._conn.get_storage_lookup_cache("poolxml")
+            if cache is None:  # pragma: no cover
+                self._parent_pool_xml = StoragePool(self._conn,
+                    parsexml=poolobj.XMLDesc(0))
+                return self._parent_pool_xml
+
+            uuid = poolobj.UUIDString()
+            if uuid not in cache:
+                cache[uuid] = StoragePool(self._conn,
+                    parsexml=poolobj.XMLDesc(0))
+            self._parent_pool_xml = cache[uuid]
         return self._parent_pool_xml
     def validate(self):
         raise NotImplementedError()
@@ -444,8 +556,7 @@ class _StorageCreator(_StorageBase):
 
     def get_path(self):
         if self._vol_install and not self._path:
-            xmlobj = StoragePool(self._conn,
-                parsexml=self._vol_install.pool.XMLDesc(0))
+            xmlobj = self.get_parent_pool_xml()
             if self.get_dev_type() == "network":
                 self._path = self._vol_install.name
             else:
@@ -462,7 +573,7 @@ class _StorageCreator(_StorageBase):
         if not self._dev_type:
             self._dev_type = _get_dev_type(self._path, self._vol_install, None,
                                            self.get_parent_pool_xml(),
-                                           self._conn.is_remote())
+                                           self._is_remote())
         return self._dev_type
 
     def get_driver_type(self):
@@ -502,7 +613,11 @@ class ManagedStorageCreator(_StorageCreator):
     def validate(self):
         return self._vol_install.validate()
     def get_size(self):
-        return float(self._vol_install.capacity) / 1024.0 / 1024.0 / 1024.0
+        return float(self._vol_install.capacity) / _BYTES_PER_GIB
+
+
+# linux/fs.h FICLONE ioctl, not exposed by the python stdlib
+_FICLONE = 0x40049409
 
 
 class CloneStorageCreator(_StorageCreator):
@@ -532,7 +647,7 @@ class CloneStorageCreator(_StorageCreator):
         else:
             vfs = os.statvfs(os.path.dirname(os.path.abspath(self._path)))
             avail = vfs.f_frsize * vfs.f_bavail
-        need = int(self._size) * 1024 * 1024 * 1024
+        need = int(self._size) * _BYTES_PER_GIB
         if need > avail:  # pragma: no cover
             if self._sparse:
                 msg = _("The filesystem will not have enough free space"
@@ -546,8 +661,8 @@ class CloneStorageCreator(_StorageCreator):
             if msg:
                 msg += " "
                 msg += (_("%(mem1)s M requested > %(mem2)s M available") %
-                        {"mem1": (need // (1024 * 1024)),
-                         "mem2": (avail // (1024 * 1024))})
+                        {"mem1": (need // _BYTES_PER_MIB),
+                         "mem2": (avail // _BYTES_PER_MIB)})
         return (ret, msg)
 
     def validate(self):
@@ -565,13 +680,124 @@ class CloneStorageCreator(_StorageCreator):
         text = (_("Cloning %(srcfile)s") %
                 {'srcfile': os.path.basename(self._input_path)})
 
-        size_bytes = int(self.get_size() * 1024 * 1024 * 1024)
+        size_bytes = int(self.get_size() * _BYTES_PER_GIB)
         progresscb.start(filename=self._output_path, size=size_bytes,
                          text=text)
 
         # Plain file clone
         self._clone_local(progresscb, size_bytes)
 
+    def _fallocate_helper(self, dst_fd, size_bytes):
+        """
+        Reserve the full size up front for non-sparse output, so we
+        fail fast on ENOSPC rather than mid-copy, and the filesystem
+        can hand out contiguous extents.
+        """
+        if not size_bytes:
+            return  # pragma: no cover
+        try:
+            os.posix_fallocate(dst_fd, 0, size_bytes)
+        except OSError as e:  # pragma: no cover
+            log.debug("posix_fallocate failed: %s", e)
+
+    def _clone_reflink_helper(self, meter, src_fd, dst_fd, size_bytes):
+        """
+        Try an instant copy-on-write clone with the FICLONE ioctl,
+        supported by btrfs and xfs. This shares extents between the
+        files, so no data is copied at all and holes are preserved.
+
+        Returns False if the filesystem can't reflink, so the caller
+        falls back to a regular copy.
+        """
+        try:
+            fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        except OSError as e:
+            # EOPNOTSUPP, EXDEV, EINVAL: no reflink for this fs combo
+            log.debug("FICLONE failed, using regular copy: %s", e)
+            return False
+        meter.end(size_bytes)
+        return True
+
+    def _clone_sendfile_helper(self, meter, src_fd, dst_fd, size_bytes,
+            clone_block_size):
+        """
+        Copy the disk with in-kernel os.sendfile, which skips dragging
+        every block through a userspace buffer.
+
+        Returns False if sendfile can't handle these fds, so the caller
+        falls back to the plain read/write loop.
+        """
+        offset = 0
+        while 1:
+            try:
+                count = os.sendfile(dst_fd, src_fd, offset,
+                                    clone_block_size)
+            except OSError as e:  # pragma: no cover
+                if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS):
+                    # Not supported for this file/filesystem combo
+                    log.debug("sendfile failed, using read/write: %s", e)
+                    return False
+                raise
+            if count == 0:
+                meter.end(size_bytes)
+                break
+            offset += count
+            if offset < size_bytes:
+                meter.update(offset)
+        return True
+
+    def _sparse_write_helper(self, dst_fd, buf):
+        """
+        Write out a buffer that is not entirely zeros, but still seek
+        over any zero runs so they stay holes in the output. Scans with
+        a memoryview to avoid copying the buffer chunk by chunk.
+        """
+        chunk = 4096
+        zeros = b'\0' * chunk
+        view = memoryview(buf)
+
+        pending = 0
+        for start in range(0, len(buf), chunk):
+            piece = view[start:start + chunk]
+            # probe the first byte to skip the full compare for the
+            # common case of a chunk holding data
+            if buf[start] == 0 and piece == zeros:
+                if pending:
+                    os.write(dst_fd, view[start - pending:start])
+                    pending = 0
+                os.lseek(dst_fd, chunk, 1)
+            else:
+                pending += len(piece)
+        if pending:
+            os.write(dst_fd, view[len(buf) - pending:])
+
+    def _clone_readwrite_helper(self, meter, src_fd, dst_fd, size_bytes,
+            sparse, clone_block_size):
+        zeros = b'\0' * clone_block_size
+
+        i = 0
+        while 1:
+            l = os.read(src_fd, clone_block_size)
+            s = len(l)
+            if s == 0:
+                meter.end(size_bytes)
+                break
+            # check sequence of zeros with one big compare, and only
+            # scan for individual holes if the buffer is mixed content.
+            # The first byte probe skips the compare for data buffers
+            if sparse and l[0] == 0 and zeros[:s] == l:
+                os.lseek(dst_fd, s, 1)
+            elif sparse:
+                self._sparse_write_helper(dst_fd, l)
+            else:
+                b = os.write(dst_fd, l)
+                if s != b:  # pragma: no cover
+                    meter.end(i)
+                    break
+            i += s
+            if i < size_bytes:
+                meter.update(i)
+
     def _clone_local(self, meter, size_bytes):
         if self._input_path == "/dev/null":  # pragma: no cover
             # Not really sure why this check is here,
@@ -586,7 +812,7 @@ class CloneStorageCreator(_StorageCreator):
         # this priority takes an existing file.
 
         if (not os.path.exists(self._output_path) and self._sparse):
-            clone_block_size = 4096
+            clone_block_size = 1024 * 1024
             sparse = True
             fd = None
             try:
@@ -604,8 +830,6 @@ class CloneStorageCreator(_StorageCreator):
                       self._input_path, self._output_path,
                       sparse, clone_block_size)
 
-        zeros = b'\0' * 4096
-
         src_fd, dst_fd = None, None
         try:
             try:
@@ -613,24 +837,25 @@ class CloneStorageCreator(_StorageCreator):
                 dst_fd = os.open(self._output_path,
                                  os.O_WRONLY | os.O_CREAT, 0o640)
 
-                i = 0
-                while 1:
-                    l = os.read(src_fd, clone_block_size)
-                    s = len(l)
-                    if s == 0:
-                        meter.end(size_bytes)
-                        break
-                    # check sequence of zeros
-                    if sparse and zeros == l:
-                        os.lseek(dst_fd, s, 1)
-                    else:
-                        b = os.write(dst_fd, l)
-                        if s != b:  # pragma: no cover
-                            meter.end(i)
-                            break
-                    i += s
-                    if i < size_bytes:
-                        meter.update(i)
+                try:
+                    # Tell the kernel we read the source strictly
+                    # sequentially, so it keeps readahead aggressive
+                    os.posix_fadvise(src_fd, 0, 0,
+                                     os.POSIX_FADV_SEQUENTIAL)
+                except OSError:  # pragma: no cover
+                    pass
+
+                done = self._clone_reflink_helper(
+                        meter, src_fd, dst_fd, size_bytes)
+                if not done and not sparse:
+                    self._fallocate_helper(dst_fd, size_bytes)
+                    done = self._clone_sendfile_helper(
+                            meter, src_fd, dst_fd, size_bytes,
+                            clone_block_size)
+                if not done:
+                    self._clone_readwrite_helper(
+                            meter, src_fd, dst_fd, size_bytes,
+                            sparse, clone_block_size)
             except OSError as e:  # pragma: no cover
                 log.debug("Error while cloning", exc_info=True)
                 msg = (_("Error cloning diskimage "
@@ -712,6 +937,8 @@ class StorageBackend(_StorageBase):
         self._exists = None
         self._size = None
         self._dev_type = None
+        self._statinfo = None
+        self._statinfo_checked = False
 
 
     ##############
@@ -723,6 +950,17 @@ class StorageBackend(_StorageBase):
             return self.get_vol_xml().target_path
         return self._path
 
+    def _get_statinfo(self):
+        """
+        Single os.stat result shared by exists/get_size/get_dev_type,
+        None if the path isn't locally accessible
+        """
+        if not self._statinfo_checked:
+            self._statinfo_checked = True
+            if self._path and not self._is_remote():
+                self._statinfo = _stat_disk(self._path)
+        return self._statinfo
+
     def get_vol_object(self):
         return self._vol_object
     def get_vol_xml(self):
@@ -744,8 +982,8 @@ class StorageBackend(_StorageBase):
             if self._vol_object:
                 ret = self.get_vol_xml().capacity
             elif self._path:
-                ret = _get_size(self._path)
-            self._size = (float(ret) / 1024.0 / 1024.0 / 1024.0)
+                ret = _get_size(self._path, self._get_statinfo())
+            self._size = (float(ret) / _BYTES_PER_GIB)
         return self._size
 
     def exists(self):
@@ -755,14 +993,14 @@ class StorageBackend(_StorageBase):
             elif self._path is None:
                 self._exists = True
             elif (not self.get_dev_type() == "network" and
-                  not self._conn.is_remote() and
-                  os.path.exists(self._path)):
+                  not self._is_remote() and
+                  self._get_statinfo() is not None):
                 self._exists = True
             elif self._parent_pool:
                 self._exists = False
             elif self.get_dev_type() == "network":
                 self._exists = True
-            elif (self._conn.is_remote() and
+            elif (self._is_remote() and
                   not _can_auto_manage(self._path)):
                 # This allows users to pass /dev/sdX and we don't try to
                 # validate it exists on the remote connection, since
@@ -783,7 +1021,8 @@ class StorageBackend(_StorageBase):
                 vol_xml = self.get_vol_xml()
             self._dev_type = _get_dev_type(self._path, vol_xml, self._vol_object,
                                            self.get_parent_pool_xml(),
-                                           self._conn.is_remote())
+                                           self._is_remote(),
+                                           self._get_statinfo())
         return self._dev_type
 
     def get_driver_type(self):
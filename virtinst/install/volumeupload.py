@@ -21,6 +21,7 @@ def _build_pool(conn, meter, path):
     if pool:  # pragma: no cover
         log.debug("Existing pool '%s' found for %s", pool.name(), path)
         StoragePool.ensure_pool_is_running(pool, refresh=True)
+        conn.invalidate_storage_lookup_caches()
         return pool
 
     name = StoragePool.find_free_name(conn, "boot-scratch")
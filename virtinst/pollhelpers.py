@@ -5,6 +5,10 @@
 # See the COPYING file in the top-level directory.
 #
 
+import sys
+
+import libvirt
+
 from .logger import log
 
 
@@ -12,61 +16,82 @@ def _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb):
     """
     Helper for new style listAll* APIs
     """
-    current = {}
-    new = {}
+    current = []
+    new = []
     objs = []
 
     try:
         if support_cb():
             objs = list_cb()
-    except Exception as e:  # pragma: no cover
+    except (libvirt.libvirtError, AttributeError) as e:  # pragma: no cover
+        # AttributeError can happen if the connection is in the
+        # process of closing underneath us
         log.debug("Unable to list all %ss: %s", typename, e)
 
-    for obj in objs:
-        name = obj.name()
-
-        if name not in origmap:
+    # Objects are diffed by name every poll period, so intern the
+    # strings: repeat dict hits become pointer comparisons instead
+    # of fresh hash plus char-by-char equality work
+    names = [sys.intern(obj.name()) for obj in objs]
+
+    if names and len(names) == len(origmap) and \
+       all(name in origmap for name in names):
+        # Same object set as the last period, the steady state for
+        # every tick that didn't see a config change: nothing is new
+        # and nothing is gone
+        return ([], [], list(origmap.values()))
+
+    for obj, name in zip(objs, names):
+        # single .get() instead of a membership test plus an index
+        got = origmap.get(name)
+        if got is None:
             # Object is brand new this period
-            current[name] = build_cb(obj, name)
-            new[name] = current[name]
-        else:
-            # Previously known object
-            current[name] = origmap[name]
-            del(origmap[name])
+            got = build_cb(obj, name)
+            new.append(got)
+        current.append(got)
+
+    # Anything we knew about but didn't see this period is gone.
+    # Set difference over the keys beats deleting entries from
+    # origmap one by one as they are seen
+    gone = [origmap[name] for name in origmap.keys() - set(names)]
+
+    return (gone, new, current)
+
+
+# typename -> (connection listAll API name, support check name)
+_FETCH_INFO = {
+    "network": ("listAllNetworks", "conn_network"),
+    "pool": ("listAllStoragePools", "conn_storage"),
+    "nodedev": ("listAllDevices", "conn_nodedev"),
+    "domain": ("listAllDomains", "conn_domain"),
+}
+
 
-    return (list(origmap.values()), list(new.values()), list(current.values()))
+def _fetch_helper(backend, typename, origmap, build_cb):
+    list_name, support_name = _FETCH_INFO[typename]
+    return _new_poll_helper(origmap, typename,
+                            getattr(backend, list_name), build_cb,
+                            getattr(backend.support, support_name))
 
 
 def fetch_nets(backend, origmap, build_cb):
-    typename = "network"
-    list_cb = backend.listAllNetworks
-    support_cb = backend.support.conn_network
-    return _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb)
+    return _fetch_helper(backend, "network", origmap, build_cb)
 
 
 def fetch_pools(backend, origmap, build_cb):
-    typename = "pool"
-    list_cb = backend.listAllStoragePools
-    support_cb = backend.support.conn_storage
-    return _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb)
+    return _fetch_helper(backend, "pool", origmap, build_cb)
 
 
 def fetch_volumes(backend, pool, origmap, build_cb):
-    typename = "volume"
-    list_cb = pool.listAllVolumes
-    support_cb = backend.support.conn_storage
-    return _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb)
+    # Volumes hang off a pool object, not the connection, so they
+    # don't fit the _FETCH_INFO table
+    return _new_poll_helper(origmap, "volume",
+                            pool.listAllVolumes, build_cb,
+                            backend.support.conn_storage)
 
 
 def fetch_nodedevs(backend, origmap, build_cb):
-    typename = "nodedev"
-    list_cb = backend.listAllDevices
-    support_cb = backend.support.conn_nodedev
-    return _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb)
+    return _fetch_helper(backend, "nodedev", origmap, build_cb)
 
 
 def fetch_vms(backend, origmap, build_cb):
-    typename = "domain"
-    list_cb = backend.listAllDomains
-    support_cb = backend.support.conn_domain
-    return _new_poll_helper(origmap, typename, list_cb, build_cb, support_cb)
+    return _fetch_helper(backend, "domain", origmap, build_cb)
@@ -201,13 +201,19 @@ class StoragePool(_StorageObject):
 
         :param pool_object: vmmStoragePool to check/start
         :param refresh: If True, run refresh() as well
+        :returns: True if the pool was started or refreshed, meaning
+            its contents may have changed
         """
+        changed = False
         if pool_object.info()[0] != libvirt.VIR_STORAGE_POOL_RUNNING:
             log.debug("starting pool=%s", pool_object.name())
             pool_object.create(0)
+            changed = True
         if refresh:
             log.debug("refreshing pool=%s", pool_object.name())
             pool_object.refresh(0)
+            changed = True
+        return changed
 
 
     ######################
@@ -489,7 +495,8 @@ class StorageVolume(_StorageObject):
             return generatename.check_libvirt_collision(
                 pool_object.storageVolLookupByName, tryname)
 
-        StoragePool.ensure_pool_is_running(pool_object, refresh=True)
+        if StoragePool.ensure_pool_is_running(pool_object, refresh=True):
+            conn.invalidate_storage_lookup_caches()
         return generatename.generate_name(basename, cb, **kwargs)
 
     TYPE_FILE = getattr(libvirt, "VIR_STORAGE_VOL_FILE", 0)
@@ -515,7 +522,8 @@ class StorageVolume(_StorageObject):
     def _get_pool(self):
         return self._pool
     def _set_pool(self, newpool):
-        StoragePool.ensure_pool_is_running(newpool)
+        if StoragePool.ensure_pool_is_running(newpool):
+            self.conn.invalidate_storage_lookup_caches()
         self._pool = newpool
         self._pool_xml = StoragePool(self.conn,
             parsexml=self._pool.XMLDesc(0))
@@ -700,6 +708,9 @@ class StorageVolume(_StorageObject):
 
             meter.end(self.capacity)
             log.debug("Storage volume '%s' install complete.", self.name)
+            # The new volume may satisfy path lookups that previously
+            # came back empty
+            self.conn.invalidate_storage_lookup_caches()
             return vol
         except Exception as e:
             log.debug("Error creating storage volume", exc_info=True)
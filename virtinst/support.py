@@ -181,10 +181,12 @@ def _make(*args, **kwargs):
     support_obj = _SupportCheck(*args, **kwargs)
 
     def cache_wrapper(self, data=None):
-        if support_obj not in self._cache:
+        try:
+            return self._cache[support_obj]
+        except KeyError:
             support_ret = support_obj(self._virtconn, data or self._virtconn)
             self._cache[support_obj] = support_ret
-        return self._cache[support_obj]
+            return support_ret
 
     return cache_wrapper
 